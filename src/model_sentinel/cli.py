@@ -1,4 +1,5 @@
 import argparse
+import logging
 
 from model_sentinel import __version__, verify_hf_model, verify_local_model
 from model_sentinel.verify.verify import Verify
@@ -7,6 +8,9 @@ from model_sentinel.verify.verify import Verify
 def main():
     DEFAULT_REVISION = "main"
 
+    # Progress messages from the download paths are emitted via logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(description="Model Sentinel CLI")
     parser.add_argument(
         "--version", action="version", version=f"model-sentinel {__version__}"
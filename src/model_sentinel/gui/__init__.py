@@ -4,3 +4,22 @@ Model Sentinel GUI Module.
 This module provides a web-based graphical user interface for the Model Sentinel
 verification functionality using Gradio.
 """
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def get_gui_entry_points():
+    """Import and return the GUI entry points, once per process.
+
+    Importing the GUI pulls in Gradio and its dependencies, which takes
+    hundreds of milliseconds; callers that verify repeatedly in one
+    process (e.g. a long-running server) pay that only on the first call.
+
+    Returns:
+        Tuple of (launch_gui_with_result, prepare_gui_verification_result)
+    """
+    from model_sentinel.gui.gui import launch_gui_with_result
+    from model_sentinel.gui.utils import prepare_gui_verification_result
+
+    return launch_gui_with_result, prepare_gui_verification_result
@@ -160,7 +160,9 @@ def _complete_verification(
             approved_files.append(filename)
 
     # Build session records and try to always write run metadata on partial approval
-    verify = Verify()
+    # Reuse the Verify instance attached by the target layer when available so the
+    # storage manager is not re-initialized for the save step.
+    verify = verification_result.get("_verify") or Verify()
     try:
         session_files = []
         for i, fi in enumerate(files_to_verify):
@@ -170,6 +172,7 @@ def _complete_verification(
                     "filename": fname,
                     "hash": fi.get("hash", ""),
                     "content": fi.get("content", ""),
+                    "size": fi.get("size"),
                     "approved": (i < len(checkbox_values)) and bool(checkbox_values[i]),
                 }
             )
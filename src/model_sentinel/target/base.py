@@ -0,0 +1,282 @@
+import sys
+from pathlib import Path
+
+from model_sentinel.verify.storage import StorageManager, scan_files_by_pattern
+from model_sentinel.verify.verify import Verify
+
+VERIFICATION_FAILED_MESSAGE = "Model verification failed. Exiting for security reasons."
+
+
+def fail_verification(exit_on_reject: bool) -> bool:
+    """Report verification failure and optionally abort the process.
+
+    Raises SystemExit instead of calling exit() so callers that verify
+    many models (or hold thread pools open) unwind through context
+    managers and finally blocks instead of being cut off.
+
+    Args:
+        exit_on_reject: If True, raise SystemExit(1) after reporting
+
+    Returns:
+        bool: Always False, for use as the caller's return value
+    """
+    print(VERIFICATION_FAILED_MESSAGE)
+    if exit_on_reject:
+        raise SystemExit(1)
+    return False
+
+# Directory names that never contain model source files
+_SKIP_DIR_NAMES = frozenset({"__pycache__", ".git"})
+
+
+class TargetBase:
+    """
+    Base class for all target implementations.
+    """
+
+    def __init__(self):
+        self.verify = Verify()
+        self.storage = StorageManager()
+
+    def _calculate_file_hash(self, file_path: Path | str) -> str:
+        """Calculate SHA256 hash for a file."""
+        return self.storage.calculate_file_hash(file_path)
+
+    def _get_files_by_pattern(
+        self, directory: Path | str, pattern: str = "*.py"
+    ) -> list[Path]:
+        """
+        Get list of files in directory matching the pattern.
+
+        Uses the shared scandir-based walker; __pycache__ and .git subtrees
+        are skipped.
+
+        Args:
+            directory: Directory path to search
+            pattern: Glob pattern to match files
+
+        Returns:
+            list[Path]: List of matching file paths
+        """
+        return scan_files_by_pattern(directory, pattern, _SKIP_DIR_NAMES)
+
+    def _calculate_directory_hash(
+        self,
+        directory: Path | str,
+        pattern: str = "*.py",
+        files: list[Path] = None,
+    ) -> str:
+        """Calculate SHA256 hash of a directory.
+
+        An already-enumerated file list can be passed via files to avoid
+        re-walking the tree.
+        """
+        return self.storage.calculate_directory_hash(directory, pattern, files=files)
+
+    def _read_file_content(self, file_path: Path | str) -> str:
+        """
+        Read file content as text.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            str: File content
+        """
+        return Path(file_path).read_text(encoding="utf-8")
+
+    def _load_approved_hashes(self, model_dir: Path) -> dict:
+        """Load the approved filename-to-hash map for a model.
+
+        Args:
+            model_dir: Model directory
+
+        Returns:
+            dict: Mapping of approved file path to its verified hash
+        """
+        metadata = self.verify.storage.load_metadata(model_dir)
+        return {
+            item.get("path"): item.get("hash")
+            for item in metadata.get("approved_files", [])
+        }
+
+    def _verify_files_workflow(
+        self, files_to_check: list[dict], model_dir: Path
+    ) -> bool:
+        """
+        Common workflow for verifying multiple files using directory system.
+
+        Args:
+            files_to_check: List of dicts with 'path', 'filename', 'hash', 'content'
+            model_dir: Model directory
+
+        Returns:
+            bool: True if all files verified successfully
+        """
+        # Ensure storage directories exist
+        self.storage.ensure_directories()
+
+        # Diff current hashes against approved hashes in one pass instead of
+        # reloading metadata per file; only changed/new files enter the
+        # interactive loop below.
+        approved_hashes = self._load_approved_hashes(model_dir)
+        changed_files = [
+            file_info
+            for file_info in files_to_check
+            if approved_hashes.get(file_info["filename"]) != file_info["hash"]
+        ]
+
+        all_verified = True
+        session: list[dict] = []
+        # Trust decisions made earlier in this session, keyed by file hash,
+        # so identical file contents are only prompted for once.
+        session_decisions: dict[str, bool] = {}
+        verify = self.verify
+
+        if not changed_files and files_to_check:
+            print("No changes detected in any file.")
+
+        # With several changed files, offer one batched pager/prompt session
+        # instead of blocking on input() once per file. The user can still
+        # drop into the per-file flow by answering "s".
+        batch_results = None
+        if len(changed_files) > 1:
+            batch_results = verify.verify_files_batch(changed_files, model_dir)
+        if batch_results is not None:
+            for file_info in changed_files:
+                approved = batch_results[file_info["filename"]]
+                session.append(
+                    {
+                        "filename": file_info["filename"],
+                        "hash": file_info["hash"],
+                        "content": file_info["content"],
+                        "size": file_info.get("size"),
+                        "approved": approved,
+                    }
+                )
+                if not approved:
+                    all_verified = False
+            changed_files = []
+
+        for file_info in changed_files:
+            filename = file_info["filename"]
+            file_hash = file_info["hash"]
+            content = file_info["content"]
+
+            # One buffered write per file instead of several print calls;
+            # this matters when stdout is a slow terminal or a pipe.
+            if filename not in approved_hashes:
+                note = f"No previous hash found for {filename}. This is the first check."
+            else:
+                note = f"Changes detected in {filename}!"
+            sys.stdout.write(f"File: {filename}, Hash: {file_hash}\n{note}\n")
+
+            if file_hash in session_decisions:
+                file_verified = session_decisions[file_hash]
+                if file_verified:
+                    verify.record_verified_file(
+                        filename, file_hash, content, model_dir
+                    )
+                    print(f"Identical to an already trusted file. {filename} approved.")
+                else:
+                    print(f"Identical to a rejected file. {filename} not approved.")
+            else:
+                file_verified = verify.verify_file(
+                    filename, file_hash, content, model_dir
+                )
+                session_decisions[file_hash] = file_verified
+            session.append(
+                {
+                    "filename": filename,
+                    "hash": file_hash,
+                    "content": content,
+                    "size": file_info.get("size"),
+                    "approved": bool(file_verified),
+                }
+            )
+            if not file_verified:
+                all_verified = False
+
+        # Always write run metadata (even if not all verified)
+        try:
+            self.verify.save_run_metadata(model_dir, session)
+        except Exception as e:
+            # Do not fail verification due to metadata write
+            print(f"Warning: failed to write run metadata: {e}")
+
+        # Persist any file hashes computed during this workflow
+        self.storage.flush_hash_cache()
+
+        return all_verified
+
+    def get_model_directory_path(self, model_key: str, model_path: Path = None) -> Path:
+        """
+        Get directory path for model based on type.
+
+        Args:
+            model_key: Model key (e.g., "local/bert_a1b2c3d4" or "hf/microsoft/DialoGPT-medium@main")
+            model_path: Original model path (for local models)
+
+        Returns:
+            Path to model directory
+        """
+        model_type, model_id = model_key.split("/", 1)
+
+        if model_type == "local":
+            if model_path:
+                # Generate directory name and create if needed
+                model_dir = self.storage.get_local_model_dir(model_path)
+                # Save original path
+                self.storage.save_original_path(model_dir, str(model_path))
+                return model_dir
+            else:
+                # Use existing directory name
+                return self.storage.local_dir / model_id
+        elif model_type == "hf":
+            if "@" in model_id:
+                repo_id, revision = model_id.rsplit("@", 1)
+            else:
+                repo_id, revision = model_id, "main"
+            return self.storage.get_hf_model_dir(repo_id, revision)
+        else:
+            raise ValueError(f"Unknown model type: {model_type}")
+
+    def check_model_hash_changed(self, model_dir: Path, current_hash: str) -> bool:
+        """
+        Check if model hash has changed using directory system.
+
+        Args:
+            model_dir: Model directory
+            current_hash: Current hash to compare
+
+        Returns:
+            bool: True if hash changed or is new, False if unchanged
+        """
+        metadata = self.storage.load_metadata(model_dir)
+        previous_hash = metadata.get("model_hash")
+
+        if previous_hash == current_hash:
+            print("No changes detected in the model.")
+            return False
+
+        if previous_hash is None:
+            print("No previous hash found. This is the first check.")
+        else:
+            print("Changes detected!")
+            print(f"Previous hash: {previous_hash}")
+            print(f"Current hash:  {current_hash}")
+
+        return True
+
+    def update_model_hash(self, model_dir: Path, new_hash: str):
+        """Update model hash using directory system."""
+        self.verify.update_model_hash(model_dir, new_hash)
+
+    def register_model_in_registry(
+        self, model_type: str, model_id: str, original_path: str = None
+    ):
+        """Register model in the global registry."""
+        kwargs = {}
+        if original_path:
+            kwargs["original_path"] = original_path
+        self.storage.register_model(model_type, model_id, **kwargs)
@@ -0,0 +1,560 @@
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from model_sentinel.target.base import TargetBase, fail_verification
+
+# Per-file download messages go through logging so they are buffered by the
+# handler instead of issuing one flushed write() per print call; the CLI
+# installs a plain-format handler in main().
+log = logging.getLogger("model_sentinel.hf")
+
+# Resolved lazily in _get_hf_api so that importing this module (e.g. for CLI
+# maintenance subcommands) does not pay the huggingface_hub import cost.
+HfApi = None
+
+# Number of concurrent file downloads. Downloads are network-bound, so a modest
+# pool collapses N sequential round-trips into roughly one. Override with the
+# MODEL_SENTINEL_DOWNLOAD_WORKERS environment variable.
+DOWNLOAD_WORKERS = int(os.getenv("MODEL_SENTINEL_DOWNLOAD_WORKERS", "8"))
+
+# With this many files to fetch, one snapshot_download (which resolves the
+# revision once and parallelizes internally) beats per-file downloads that
+# each pay their own metadata round trip.
+SNAPSHOT_DOWNLOAD_THRESHOLD = 5
+
+# How long a memoized model_info response stays valid. Long enough to cover
+# one verification run, short enough that long-lived processes see new
+# commits.
+MODEL_INFO_TTL_SECONDS = 30
+
+_HTTP_BACKEND_CONFIGURED = False
+
+
+def _py_siblings(siblings) -> list:
+    """Filter siblings down to .py files in one pass.
+
+    The slice comparison skips the bound-method dispatch of str.endswith,
+    which is measurable when a snapshot lists thousands of files.
+    """
+    return [s for s in siblings if s.rfilename[-3:] == ".py"]
+
+
+def _enable_hf_transfer() -> None:
+    """Enable the Rust multi-connection downloader when available.
+
+    hf_hub_download picks HF_HUB_ENABLE_HF_TRANSFER up from the environment;
+    setdefault keeps any explicit user setting. Set
+    MODEL_SENTINEL_FAST_DOWNLOAD=0 to opt out (hf_transfer can saturate CPU
+    on small machines).
+    """
+    if os.getenv("MODEL_SENTINEL_FAST_DOWNLOAD", "1") == "0":
+        return
+    try:
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        return
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
+def _configure_http_backend() -> None:
+    """Install a pooled keep-alive HTTP session for huggingface_hub.
+
+    Mounting one requests.Session with a sized connection pool avoids a TCP
+    and TLS handshake per request when many files are fetched concurrently.
+    huggingface_hub >= 1.0 pools connections itself and no longer exposes
+    configure_http_backend, so this is a no-op there.
+    """
+    global _HTTP_BACKEND_CONFIGURED
+    if _HTTP_BACKEND_CONFIGURED:
+        return
+    _HTTP_BACKEND_CONFIGURED = True
+
+    try:
+        import requests
+        from huggingface_hub import configure_http_backend
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        return
+
+    def _make_session():
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    configure_http_backend(backend_factory=_make_session)
+
+
+class TargetHF(TargetBase):
+    """
+    Target class for model-sentinel to track Hugging Face model changes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._hf_api = None
+        self._model_info_cache: dict[tuple, object] = {}
+
+    def _get_hf_api(self):
+        """Return a shared HfApi instance (reuses the HTTP session)."""
+        if self._hf_api is None:
+            global HfApi
+            if HfApi is None:
+                from huggingface_hub import HfApi
+            _configure_http_backend()
+            _enable_hf_transfer()
+            self._hf_api = HfApi()
+        return self._hf_api
+
+    def _get_model_info(self, repo_id, revision=None, files_metadata=False):
+        """Fetch model info once per (repo_id, revision) and memoize it.
+
+        The plain listing is enough for the model-hash check (.sha) and for
+        spotting .py files (.siblings); the heavier files_metadata=True
+        response (per-file LFS/blob metadata) is only fetched when a caller
+        asks for it, and then upgrades the cached entry so later light
+        requests reuse it. Entries expire after MODEL_INFO_TTL_SECONDS so
+        long-lived processes pick up new commits.
+        """
+        key = (repo_id, revision)
+        entry = self._model_info_cache.get(key)
+        now = time.monotonic()
+        if (
+            entry is not None
+            and now - entry[1] <= MODEL_INFO_TTL_SECONDS
+            and (entry[2] or not files_metadata)
+        ):
+            return entry[0]
+        model_info = self._get_hf_api().model_info(
+            repo_id=repo_id, revision=revision, files_metadata=files_metadata
+        )
+        self._model_info_cache[key] = (model_info, now, files_metadata)
+        return model_info
+
+    def detect_model_changes(self, repo_id, revision=None) -> str | None:
+        """
+        Check if model hash has changed, and return the new hash if changed or new.
+
+        Returns:
+            New model hash if changed or new, None if no changes detected.
+        """
+        # Get the new model hash from Hugging Face API
+        model_info = self._get_model_info(repo_id, revision)
+        current_hash = model_info.sha
+
+        print(f"Checking repository: {repo_id}")
+        if revision:
+            print(f"Revision: {revision}")
+        print(f"Current model hash: {current_hash}")
+
+        # Get directory for this model
+        model_dir_path = self.storage.get_hf_model_dir(repo_id, revision or "main")
+
+        if not super().check_model_hash_changed(model_dir_path, current_hash):
+            return None
+
+        # Return current model hash to update later
+        return current_hash
+
+    def update_model_hash_for_repo(self, repo_id, revision, new_model_hash):
+        """Update the model hash using directory system."""
+        model_dir_path = self.storage.get_hf_model_dir(repo_id, revision or "main")
+        super().update_model_hash(model_dir_path, new_model_hash)
+
+    def verify_remote_files(self, repo_id, revision=None) -> bool:
+        """Check remote *.py files for changes and prompt for verification.
+
+        Returns:
+            True if all files are verified, False otherwise.
+        """
+        hf_api = self._get_hf_api()
+        model_info = self._get_model_info(repo_id, revision)
+
+        print(f"Checking Python files in repository: {repo_id}")
+        if revision:
+            print(f"Revision: {revision}")
+
+        # Weights-only repos are the common case; bail out before paying for
+        # the per-file metadata listing or any storage work.
+        if not _py_siblings(model_info.siblings):
+            print("No Python files found in the repository.")
+            return True
+
+        model_info = self._get_model_info(repo_id, revision, files_metadata=True)
+
+        # Get directory path for this model
+        model_dir_path = self.storage.get_hf_model_dir(repo_id, revision or "main")
+
+        # Files whose blob_id still matches the approved hash need no
+        # download at all; only changed/new files are fetched.
+        approved_hashes = self._load_approved_hashes(model_dir_path)
+        py_siblings = _py_siblings(model_info.siblings)
+        changed_siblings = [
+            s for s in py_siblings if approved_hashes.get(s.rfilename) != s.blob_id
+        ]
+
+        if py_siblings and not changed_siblings:
+            print("No changes detected in any file.")
+
+        # Download changed files concurrently; user prompts stay strictly
+        # sequential in the common workflow below. Pin downloads to the
+        # commit sha already resolved by model_info: a branch name could
+        # resolve to an older snapshot in the local HF cache, serving stale
+        # bytes for files whose blob_id just changed.
+        pinned_revision = getattr(model_info, "sha", None) or revision
+        contents = self._download_files_parallel(
+            hf_api, repo_id, pinned_revision, changed_siblings
+        )
+        if contents is None:
+            # If any download failed, consider verification failed
+            return False
+
+        files_to_check = [
+            {
+                "filename": sibling.rfilename,
+                "hash": sibling.blob_id,
+                "content": contents[sibling.rfilename],
+            }
+            for sibling in changed_siblings
+        ]
+
+        # Use common verification workflow
+        return self._verify_files_workflow(files_to_check, model_dir_path)
+
+    def _download_files_parallel(
+        self, hf_api, repo_id, revision, siblings, skip_failed: bool = False
+    ) -> dict[str, str] | None:
+        """Download sibling files concurrently.
+
+        Returns:
+            Mapping of filename to content. If any download failed, returns
+            None, or the successful subset when skip_failed is True.
+        """
+        # HF repos often contain byte-identical .py files (same blob_id);
+        # download each unique blob once and fan the content out to aliases.
+        by_blob: dict[str, list[str]] = {}
+        for sibling in siblings:
+            by_blob.setdefault(sibling.blob_id, []).append(sibling.rfilename)
+
+        # For many files, one snapshot call amortizes revision resolution and
+        # connection setup across all of them.
+        if len(by_blob) >= SNAPSHOT_DOWNLOAD_THRESHOLD:
+            contents = self._download_via_snapshot(repo_id, revision, siblings)
+            if contents is not None:
+                return contents
+            # Snapshot failed; fall through to per-file downloads
+
+        # With aiohttp installed, an async fan-out keeps all fetches on one
+        # event loop instead of pool threads; falls back below if missing.
+        if len(by_blob) >= 2:
+            async_contents = self._download_files_async(
+                repo_id, revision, [filenames[0] for filenames in by_blob.values()]
+            )
+            if async_contents is not None:
+                contents = {}
+                for blob_id, filenames in by_blob.items():
+                    content = async_contents.get(filenames[0])
+                    if content is None:
+                        return None
+                    for filename in filenames:
+                        contents[filename] = content
+                return contents
+
+        contents: dict[str, str] = {}
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._download_file_content,
+                    hf_api,
+                    repo_id,
+                    revision,
+                    filenames[0],
+                ): filenames
+                for filenames in by_blob.values()
+            }
+            failed = False
+            for future in as_completed(futures):
+                content = future.result()
+                if content is None:
+                    failed = True
+                    continue
+                for filename in futures[future]:
+                    contents[filename] = content
+
+        if failed and not skip_failed:
+            return None
+        return contents
+
+    def _download_files_async(
+        self, repo_id, revision, filenames
+    ) -> dict[str, str] | None:
+        """Fetch files concurrently on an asyncio event loop via aiohttp.
+
+        A single event loop amortizes connection setup across hundreds of
+        in-flight requests more efficiently than a fixed thread pool.
+
+        Returns:
+            Mapping of filename to content, or None if aiohttp is not
+            installed or any fetch failed (callers fall back to the threaded
+            downloader).
+        """
+        try:
+            import asyncio
+
+            import aiohttp
+            from huggingface_hub import hf_hub_url
+            from huggingface_hub.utils import build_hf_headers
+        except ImportError:
+            return None
+
+        async def _fetch_all():
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=16)
+            async with aiohttp.ClientSession(
+                connector=connector, headers=build_hf_headers()
+            ) as session:
+
+                async def _fetch(filename):
+                    url = hf_hub_url(repo_id, filename, revision=revision)
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return filename, await response.text()
+
+                return await asyncio.gather(
+                    *(_fetch(filename) for filename in filenames)
+                )
+
+        try:
+            results = asyncio.run(_fetch_all())
+        except Exception as e:
+            log.warning("Async download failed: %s", e)
+            return None
+        return dict(results)
+
+    def _download_via_snapshot(
+        self, repo_id, revision, siblings
+    ) -> dict[str, str] | None:
+        """Fetch all .py files with a single snapshot_download call.
+
+        Returns:
+            Mapping of filename to content, or None if the snapshot could not
+            be fetched (callers fall back to per-file downloads).
+        """
+        try:
+            from huggingface_hub import snapshot_download
+
+            local_dir = snapshot_download(
+                repo_id=repo_id,
+                revision=revision,
+                allow_patterns="*.py",
+                max_workers=DOWNLOAD_WORKERS,
+            )
+        except Exception as e:
+            log.warning("Snapshot download failed: %s", e)
+            return None
+
+        root = Path(local_dir)
+        contents: dict[str, str] = {}
+        for sibling in siblings:
+            try:
+                contents[sibling.rfilename] = (root / sibling.rfilename).read_text(
+                    encoding="utf-8"
+                )
+            except OSError as e:
+                log.warning("Error reading file %s: %s", sibling.rfilename, e)
+                return None
+        return contents
+
+    def _download_file_content(self, hf_api, repo_id, revision, filename) -> str | None:
+        """Download file content from HuggingFace.
+
+        Returns:
+            File content if successful, None if error.
+        """
+        # Cheapest path first: a pure filesystem cache probe with no HTTP
+        # HEAD revalidation. Callers pin revision to the commit sha resolved
+        # by model_info, so a cache hit here is exact: a branch name could
+        # resolve through stale cached refs to an older snapshot, but a
+        # commit sha identifies the snapshot directly.
+        try:
+            from huggingface_hub import try_to_load_from_cache
+
+            cached = try_to_load_from_cache(
+                repo_id=repo_id, filename=filename, revision=revision
+            )
+            if isinstance(cached, str):
+                return Path(cached).read_bytes().decode("utf-8")
+        except ImportError:
+            pass
+
+        log.info("Downloading file: %s", filename)
+
+        try:
+            from huggingface_hub.errors import LocalEntryNotFoundError
+
+            # Serve from the local HF cache when possible; only hit the
+            # network when the file is not cached for this revision. This
+            # is safe for the same reason as the probe above: callers pass
+            # a commit sha, not a branch name that stale refs could
+            # resolve to an older snapshot.
+            try:
+                file_path = hf_api.hf_hub_download(
+                    repo_id=repo_id,
+                    filename=filename,
+                    revision=revision,
+                    local_files_only=True,
+                )
+            except LocalEntryNotFoundError:
+                file_path = hf_api.hf_hub_download(
+                    repo_id=repo_id,
+                    filename=filename,
+                    revision=revision,
+                )
+
+            # One bulk read + one decode; text mode would add a Python-level
+            # universal-newline pass over the whole file.
+            return Path(file_path).read_bytes().decode("utf-8")
+
+        except Exception as e:
+            log.warning("Error downloading file %s: %s", filename, e)
+            return None
+
+    def _get_repo_key(self, repo_id, revision=None):
+        """Generate repository key for data directory with hf/ prefix."""
+        base_key = f"{repo_id}@{revision}" if revision else repo_id
+        return f"hf/{base_key}"
+
+    def get_files_for_verification(self, repo_id: str, revision: str = None):
+        """
+        Get list of HF model files that need verification for GUI display.
+
+        Args:
+            repo_id: Hugging Face repository ID
+            revision: Model revision/branch
+
+        Returns:
+            List of file dictionaries with filename, content, and hash
+        """
+        files_info = []
+        hf_api = self._get_hf_api()
+
+        try:
+            model_info = self._get_model_info(repo_id, revision, files_metadata=True)
+
+            py_siblings = _py_siblings(model_info.siblings)
+            # Download concurrently; failed files are simply left out of the
+            # GUI listing. Pin to the resolved commit sha so cached copies
+            # match the blob ids listed alongside them.
+            pinned_revision = getattr(model_info, "sha", None) or revision
+            contents = self._download_files_parallel(
+                hf_api, repo_id, pinned_revision, py_siblings, skip_failed=True
+            )
+            for sibling in py_siblings:
+                content = contents.get(sibling.rfilename)
+                if content is not None:
+                    files_info.append(
+                        {
+                            "filename": sibling.rfilename,
+                            "content": content,
+                            "hash": sibling.blob_id,
+                        }
+                    )
+        except Exception as e:
+            print(f"Error getting files for verification: {e}")
+
+        return files_info
+
+
+def verify_hf_model(
+    repo_id, revision=None, gui=False, exit_on_reject=True, host=None, port=None
+) -> bool:
+    """
+    Check if the model hash has changed and verify remote files.
+
+    Args:
+        repo_id: Hugging Face repository ID
+        revision: Model revision/branch
+        gui: If True, launch GUI for verification if needed
+        exit_on_reject: If True, exit the process when verification fails
+        host: Host address for GUI server (None for default)
+        port: Port for GUI server (None for default)
+
+    Returns:
+        bool: True if verification successful or no changes detected
+    """
+    target = TargetHF()
+    new_model_hash = target.detect_model_changes(repo_id, revision=revision)
+
+    # If no changes detected, model is already verified
+    if not new_model_hash:
+        print("No changes detected in the model hash. Model is already verified.")
+        return True
+
+    if gui:
+        print("Changes detected. Launching GUI for verification...")
+        result = _handle_gui_verification(
+            target, repo_id, revision, new_model_hash, host=host, port=port
+        )
+    else:
+        result = _handle_cli_verification(target, repo_id, revision, new_model_hash)
+
+    if not result:
+        return fail_verification(exit_on_reject)
+
+    return result
+
+
+def _handle_gui_verification(
+    target: TargetHF,
+    repo_id: str,
+    revision: str,
+    new_model_hash: str,
+    host: str = None,
+    port: int = None,
+) -> bool:
+    """Handle GUI-based verification."""
+    from model_sentinel.gui import get_gui_entry_points
+
+    launch_gui_with_result, prepare_gui_verification_result = get_gui_entry_points()
+
+    verify_args = (repo_id, revision)
+    files_info = target.get_files_for_verification(*verify_args)
+    display_info = [f"**Repository:** {repo_id}", f"**Revision:** {revision}"]
+
+    result = prepare_gui_verification_result(new_model_hash, files_info, display_info)
+    result.update({"target_type": "hf", "repo_id": repo_id, "revision": revision})
+    # Reuse the target's Verify instance in the GUI flow to avoid re-initializing
+    # storage when results are saved.
+    result["_verify"] = target.verify
+    return launch_gui_with_result(result, "Hugging Face", host, port)
+
+
+def _handle_cli_verification(
+    target: TargetHF, repo_id: str, revision: str, new_model_hash: str
+) -> bool:
+    """Handle CLI-based verification."""
+    print("\n" + "=" * 50)
+    print("Checking remote Python files...")
+    verified_all = target.verify_remote_files(repo_id, revision=revision)
+    print(f"File check result: {verified_all}")
+
+    if verified_all:
+        target.update_model_hash_for_repo(repo_id, revision, new_model_hash)
+
+        # Register in global registry
+        model_key = f"{repo_id}@{revision or 'main'}"
+        target.register_model_in_registry("hf", model_key)
+
+        print("Verified model hash updated.")
+        return True
+    else:
+        return False
@@ -0,0 +1,276 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from model_sentinel.target.base import TargetBase, fail_verification
+
+
+def _relative_name(file_path: Path, model_dir: Path, prefix: str) -> str:
+    """Relative POSIX-style name of a walked file under model_dir.
+
+    Fast path: a prefix strip when the directory spelling is a true prefix
+    of the walked path. pathlib normalizes spellings like "./a.py" to
+    "a.py" (so for model_dir "." the prefix never matches); those fall
+    back to relpath, which resolves the name correctly for any spelling.
+    """
+    path_str = str(file_path)
+    if path_str.startswith(prefix):
+        rel = path_str[len(prefix):]
+    else:
+        rel = os.path.relpath(path_str, model_dir)
+    return rel.replace(os.sep, "/")
+
+
+class TargetLocal(TargetBase):
+    """
+    Target class for model-sentinel to track local model changes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Model keys embed a directory content hash; computing one walks and
+        # hashes the whole tree, so memoize per directory for this instance.
+        self._model_key_cache: dict[str, str] = {}
+        # File list from the most recent detect_model_changes walk, reused by
+        # verify_local_files so the changed-model path walks the tree once.
+        self._last_scan: tuple[str, list[Path]] | None = None
+        # Storage directory per model directory: resolving it creates the
+        # directory and records the original path, so do that only once.
+        self._storage_dir_cache: dict[str, Path] = {}
+
+    def detect_model_changes(self, model_dir: Path) -> str | None:
+        """
+        Check if local model hash has changed, and return the new hash if changed or new.
+
+        Returns:
+            New model hash if changed or new, None if no changes detected.
+        """
+        print(f"Model directory: {model_dir}")
+        print(f"Checking model: {model_dir.name}")
+
+        # Get the directory hash using base class method (single tree walk)
+        file_paths = self._get_files_by_pattern(model_dir, "*.py")
+        self._last_scan = (str(model_dir), file_paths)
+        current_hash = self._calculate_directory_hash(model_dir, "*.py", files=file_paths)
+        print(f"Directory hash: {current_hash}")
+
+        # Get directory for this model
+        model_dir_path = self._get_storage_dir(model_dir)
+
+        if not super().check_model_hash_changed(model_dir_path, current_hash):
+            return None
+
+        # Return current model hash to update later
+        return current_hash
+
+    def verify_local_files(self, model_dir: Path) -> bool:
+        """
+        Check local *.py files for changes and prompt for verification.
+
+        Returns:
+            True if all files are verified, False otherwise.
+        """
+        print(f"Checking Python files in directory: {model_dir}")
+
+        # Get directory for this model
+        model_dir_path = self._get_storage_dir(model_dir)
+
+        # Prepare files for verification using common workflow, reusing the
+        # walk from detect_model_changes when it covered this directory
+        if self._last_scan is not None and self._last_scan[0] == str(model_dir):
+            file_paths = self._last_scan[1]
+        else:
+            file_paths = self._get_files_by_pattern(model_dir, "*.py")
+
+        # Hash first, read second: content is only loaded for files whose
+        # hash differs from the approved one, so unchanged files cost a
+        # cached hash lookup instead of a full read.
+        approved_hashes = self._load_approved_hashes(model_dir_path)
+        files_to_check = []
+        prefix = str(model_dir) + os.sep
+        for file_path, file_hash, _ in self._load_files_parallel(
+            file_paths, with_content=False
+        ):
+            filename = _relative_name(file_path, model_dir, prefix)
+            changed = approved_hashes.get(filename) != file_hash
+            files_to_check.append(
+                {
+                    "path": file_path,
+                    "filename": filename,
+                    "hash": file_hash,
+                    "size": file_path.stat().st_size,
+                    "content": self._read_file_content(file_path) if changed else None,
+                }
+            )
+
+        # Use common verification workflow
+        return self._verify_files_workflow(files_to_check, model_dir_path)
+
+    def _load_files_parallel(
+        self, file_paths: list[Path], with_content: bool = True
+    ) -> list[tuple[Path, str, str | None]]:
+        """Hash (and optionally read) files concurrently, preserving order.
+
+        Hashing releases the GIL and reads block on disk, so a thread pool
+        overlaps both across files.
+
+        Args:
+            file_paths: Files to process
+            with_content: If False, skip reading and return None content
+
+        Returns:
+            List of (path, hash, content) tuples in file_paths order.
+        """
+
+        def _load_one(file_path: Path) -> tuple[Path, str, str | None]:
+            return (
+                file_path,
+                self._calculate_file_hash(file_path),
+                self._read_file_content(file_path) if with_content else None,
+            )
+
+        if len(file_paths) > 1:
+            max_workers = min(32, os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_load_one, file_paths))
+        return [_load_one(file_path) for file_path in file_paths]
+
+    def _get_model_key(self, model_dir: Path) -> str:
+        """Generate model key for data directory (memoized per directory)."""
+        cache_key = str(model_dir)
+        model_key = self._model_key_cache.get(cache_key)
+        if model_key is None:
+            model_id = self.storage.generate_local_model_dir_name(model_dir)
+            model_key = f"local/{model_id}"
+            self._model_key_cache[cache_key] = model_key
+        return model_key
+
+    def _get_storage_dir(self, model_dir: Path) -> Path:
+        """Resolve the storage directory for a model (memoized per directory)."""
+        cache_key = str(model_dir)
+        storage_dir = self._storage_dir_cache.get(cache_key)
+        if storage_dir is None:
+            storage_dir = self.get_model_directory_path(
+                self._get_model_key(model_dir), model_dir
+            )
+            self._storage_dir_cache[cache_key] = storage_dir
+        return storage_dir
+
+    def get_files_for_verification(self, model_dir: Path) -> list[dict[str, str]]:
+        """
+        Get list of files that need verification for GUI display.
+
+        Args:
+            model_dir: Path to the local model directory
+
+        Returns:
+            List of file dictionaries with filename, content, and hash
+        """
+        file_paths = self._get_files_by_pattern(model_dir, "*.py")
+        prefix = str(model_dir) + os.sep
+        return [
+            {
+                "filename": _relative_name(file_path, model_dir, prefix),
+                "content": content,
+                "hash": file_hash,
+                "path": str(file_path),
+            }
+            for file_path, file_hash, content in self._load_files_parallel(file_paths)
+        ]
+
+
+def verify_local_model(
+    model_dir: str | Path, gui=False, exit_on_reject=True, host=None, port=None
+) -> bool:
+    """
+    Check if the local model hash has changed and verify local files.
+
+    Args:
+        model_dir: Path to the local model directory
+        gui: If True, launch GUI for verification if needed
+        exit_on_reject: If True, exit the process when verification fails
+        host: Host address for GUI server (None for default)
+        port: Port for GUI server (None for default)
+
+    Returns:
+        bool: True if verification successful or no changes detected
+    """
+    model_dir = Path(model_dir)
+
+    # Check if the model directory exists
+    if not model_dir.exists():
+        print(f"Model directory {model_dir} does not exist.")
+        return fail_verification(exit_on_reject)
+
+    target = TargetLocal()
+    new_model_hash = target.detect_model_changes(model_dir)
+
+    # If no changes detected, model is already verified
+    if not new_model_hash:
+        print("No changes detected in the model directory. Model is already verified.")
+        return True
+
+    # Handle verification based on mode
+    if gui:
+        print("Changes detected. Launching GUI for verification...")
+        result = _handle_gui_verification(
+            target, model_dir, new_model_hash, host=host, port=port
+        )
+    else:
+        result = _handle_cli_verification(target, model_dir, new_model_hash)
+
+    if not result:
+        return fail_verification(exit_on_reject)
+
+    return result
+
+
+def _handle_gui_verification(
+    target: TargetLocal,
+    model_dir: Path,
+    new_model_hash: str,
+    host: str = None,
+    port: int = None,
+) -> bool:
+    """Handle GUI-based verification for local models."""
+    from model_sentinel.gui import get_gui_entry_points
+
+    launch_gui_with_result, prepare_gui_verification_result = get_gui_entry_points()
+
+    verify_args = (model_dir,)
+    files_info = target.get_files_for_verification(*verify_args)
+    display_info = [f"**Model Directory:** {model_dir}"]
+
+    result = prepare_gui_verification_result(new_model_hash, files_info, display_info)
+    result.update({"target_type": "local", "model_dir": str(model_dir)})
+    # Reuse the target's Verify instance in the GUI flow to avoid re-initializing
+    # storage when results are saved.
+    result["_verify"] = target.verify
+    return launch_gui_with_result(result, "Local", host, port)
+
+
+def _handle_cli_verification(
+    target: TargetLocal, model_dir: Path, new_model_hash: str
+) -> bool:
+    """Handle CLI-based verification."""
+    print("\n" + "=" * 50)
+    print("Checking local Python files...")
+    verified_all = target.verify_local_files(model_dir)
+    print(f"File check result: {verified_all}")
+
+    if verified_all:
+        # Get directory and update hash
+        model_dir_path = target._get_storage_dir(model_dir)
+        target.update_model_hash(model_dir_path, new_model_hash)
+
+        # Register in global registry
+        target.register_model_in_registry(
+            "local",
+            target.storage.generate_local_model_dir_name(model_dir),
+            str(model_dir),
+        )
+
+        print("Verified model hash updated.")
+        return True
+    else:
+        return False
@@ -13,6 +13,7 @@ class SessionFile(TypedDict, total=False):
     filename: str
     hash: str
     content: str
+    size: int
     approved: bool
 
 
@@ -40,6 +41,7 @@ class MetadataPayload(TypedDict, total=False):
     run: RunInfo
     model_hash: str | None
     last_verified: str | None
+    original_path: str | None
     overall_status: str
     approved_files: list[FileRecord]
 
@@ -49,15 +51,16 @@ def approved_map_from_existing(existing_files: Any) -> dict[str, dict[str, Any]]
 
     Pure function: no I/O.
     """
-    approved_map: dict[str, dict[str, Any]] = {}
-    if isinstance(existing_files, list):
-        for item in existing_files:
-            approved_map[item.get("path", "")] = {
-                "hash": item.get("hash"),
-                "size": item.get("size"),
-                "verified_at": item.get("verified_at"),
-            }
-    return approved_map
+    if not isinstance(existing_files, list):
+        return {}
+    return {
+        item.get("path", ""): {
+            "hash": item.get("hash"),
+            "size": item.get("size"),
+            "verified_at": item.get("verified_at"),
+        }
+        for item in existing_files
+    }
 
 
 def files_list_from_map(approved_map: dict[str, dict[str, Any]]) -> list[FileRecord]:
@@ -65,18 +68,16 @@ def files_list_from_map(approved_map: dict[str, dict[str, Any]]) -> list[FileRec
 
     Pure function: no I/O.
     """
-    files_list: list[dict[str, Any]] = []
-    for path in sorted(approved_map.keys()):
-        rec = approved_map[path]
-        files_list.append(
-            {
-                "path": path,
-                "size": rec.get("size"),
-                "hash": rec.get("hash"),
-                "verified_at": rec.get("verified_at"),
-            }
-        )
-    return files_list
+    # Single comprehension over sorted items: no second dict lookup per path
+    return [
+        {
+            "path": path,
+            "size": rec.get("size"),
+            "hash": rec.get("hash"),
+            "verified_at": rec.get("verified_at"),
+        }
+        for path, rec in sorted(approved_map.items())
+    ]
 
 
 def compute_run_metadata(
@@ -101,10 +102,14 @@ def compute_run_metadata(
     for sf in session_files:
         if sf.get("approved"):
             fname = sf.get("filename", "")
-            content = sf.get("content", "")
+            # Prefer the on-disk size captured upstream; re-encoding content
+            # just to measure it is an O(content) pass per file
+            size = sf.get("size")
+            if size is None:
+                size = len((sf.get("content") or "").encode("utf-8"))
             approved_map[fname] = {
                 "hash": sf.get("hash", ""),
-                "size": len(str(content).encode("utf-8")),
+                "size": size,
                 "verified_at": current_timestamp,
             }
         else:
@@ -123,6 +128,7 @@ def compute_run_metadata(
         },
         "model_hash": existing_metadata.get("model_hash"),
         "last_verified": existing_metadata.get("last_verified"),
+        "original_path": existing_metadata.get("original_path"),
         "overall_status": overall,
         "approved_files": files_list,
     }
@@ -136,16 +142,22 @@ def compute_run_metadata(
 
 
 def validate_session_files(session_files: Iterable[SessionFile]) -> None:
-    seen: set[str] = set()
-    for idx, sf in enumerate(session_files):
-        fname = sf.get("filename")
-        if not fname:
-            raise ValidationError(f"Session file at index {idx} missing 'filename'.")
-        if fname in seen:
-            raise ValidationError(f"Duplicate session filename detected: {fname}")
-        seen.add(fname)
-        if "approved" in sf and not isinstance(sf["approved"], bool):
-            raise ValidationError(f"'approved' must be bool for {fname}")
+    # Collect once and validate in bulk; per-item Python loops only run on
+    # the error path to name the offending entry.
+    files = list(session_files)
+    names = [sf.get("filename") for sf in files]
+    if not all(names):
+        idx = next(i for i, name in enumerate(names) if not name)
+        raise ValidationError(f"Session file at index {idx} missing 'filename'.")
+    if len(set(names)) != len(names):
+        seen: set[str] = set()
+        dup = next(name for name in names if name in seen or seen.add(name))
+        raise ValidationError(f"Duplicate session filename detected: {dup}")
+    if not all(isinstance(sf.get("approved", False), bool) for sf in files):
+        bad = next(
+            sf for sf in files if not isinstance(sf.get("approved", False), bool)
+        )
+        raise ValidationError(f"'approved' must be bool for {bad.get('filename')}")
 
 
 def validate_metadata_payload(meta: MetadataPayload) -> None:
@@ -14,21 +14,17 @@ def build_session_files(
         approved_files: Iterable of approved filenames
 
     Returns:
-        List of session dicts: {"filename", "hash", "content", "approved"}
+        List of session dicts: {"filename", "hash", "content", "size", "approved"}
     """
 
-    approved_set = set(approved_files)
-    session: list[dict[str, Any]] = []
-
-    for fi in files_info:
-        fname = fi.get("filename", "")
-        session.append(
-            {
-                "filename": fname,
-                "hash": fi.get("hash", ""),
-                "content": fi.get("content", ""),
-                "approved": fname in approved_set,
-            }
-        )
-
-    return session
+    approved_set = frozenset(approved_files)
+    return [
+        {
+            "filename": (fname := fi.get("filename", "")),
+            "hash": fi.get("hash", ""),
+            "content": fi.get("content", ""),
+            "size": fi.get("size"),
+            "approved": fname in approved_set,
+        }
+        for fi in files_info
+    ]
@@ -1,14 +1,197 @@
 """Storage manager for Model Sentinel verification data."""
 
+import fnmatch
+import functools
 import hashlib
 import json
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    # Optional speedup: orjson parses/serializes JSON several times faster
+    # than the stdlib. Install it with: pip install 'model-sentinel[fast]'
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional speedup: BLAKE3 hashes several times faster per byte than
+    # SHA-256 on large files. Install it with: pip install 'model-sentinel[fast]'
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Read size for the hashing fallback path. 1 MiB is large enough to amortize
+# the per-read Python overhead on big files while staying cache friendly.
+HASH_CHUNK_SIZE = 1 << 20
+
+# Model weight files can be many GB; hashing their full content dominates
+# directory hashing. For these extensions only a prefix plus the file size is
+# fingerprinted (the size is mixed into the digest so truncation is caught).
+WEIGHT_FILE_EXTENSIONS = {".safetensors", ".bin", ".pt", ".onnx"}
+WEIGHT_HASH_MAX_BYTES = 10 << 20
+
+
+@functools.lru_cache(maxsize=32)
+def _glob_matcher(pattern: str):
+    """Compiled, cached name matcher for a glob pattern (case-sensitive)."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def scan_files_by_pattern(
+    directory: Path | str,
+    pattern: str = "*.py",
+    skip_dirs: frozenset[str] = frozenset(),
+) -> list[Path]:
+    """Enumerate files under a directory whose names match a glob pattern.
+
+    Walks with os.scandir rather than Path.rglob so each visited entry costs
+    a name check instead of a Path allocation plus fnmatch; plain "*.ext"
+    patterns reduce to a suffix test. Unreadable or missing directories
+    yield nothing, like rglob.
+
+    Args:
+        directory: Directory to walk
+        pattern: Glob pattern matched against entry names
+        skip_dirs: Directory names whose subtrees are not descended into
+
+    Returns:
+        list[Path]: Matching file paths (unsorted)
+    """
+    if pattern.startswith("*") and not any(c in pattern[1:] for c in "*?["):
+        suffix = pattern[1:]
+
+        def matches(name):
+            return name.endswith(suffix)
+
+    else:
+        matches = _glob_matcher(pattern)
+
+    files: list[Path] = []
+    stack = [str(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        stack.append(entry.path)
+                elif matches(entry.name):
+                    files.append(Path(entry.path))
+    return files
+
+
+@functools.lru_cache(maxsize=256)
+def _hf_dir_parts(repo_id: str, revision: str) -> tuple[str, str]:
+    """Split a repo id into its (org, "model@revision") directory parts.
+
+    Called per file during HF verification; caching makes repeats a dict
+    lookup instead of a split and two string builds.
+    """
+    if "/" in repo_id:
+        org, model = repo_id.split("/", 1)
+    else:
+        org, model = "", repo_id
+    return org, f"{model}@{revision}"
+
+
+def _new_hash_obj(algo: str = "sha256"):
+    """Create a hash object for the given algorithm.
+
+    "sha256" is the default and always available; "blake3" requires the
+    optional blake3 package and is substantially faster on large files.
+    """
+    if algo == "blake3":
+        if blake3 is None:
+            raise ValueError(
+                "blake3 is not installed. Install it with: "
+                "pip install 'model-sentinel[fast]'"
+            )
+        return blake3.blake3()
+    if algo != "sha256":
+        raise ValueError(f"Unsupported hash algorithm: {algo}")
+    return hashlib.sha256()
+
+
+def _hash_file_sha256(f) -> "hashlib._Hash":
+    """Hash an open binary file with SHA-256.
+
+    Uses hashlib.file_digest (Python 3.11+), which runs the read/update loop
+    in C; older interpreters fall back to a chunked Python loop.
+    """
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(f, "sha256")
+
+    hash_obj = hashlib.sha256()
+    while chunk := f.read(HASH_CHUNK_SIZE):
+        hash_obj.update(chunk)
+    return hash_obj
+
+
+def _hash_large_file(f, algo: str = "sha256") -> str:
+    """Hash an open binary file, memory-mapping it when possible.
+
+    Feeding one contiguous mmap region to the hash backend removes the
+    Python-level read loop entirely; the OpenSSL kernel consumes the mapped
+    pages directly. Falls back to streaming reads where mmap is unavailable
+    (empty files, special files, some filesystems).
+    """
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # One linear pass: tell the kernel to read ahead aggressively
+                # and drop pages behind us
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if algo == "blake3" and blake3 is not None:
+                # BLAKE3's tree structure lets it hash one contiguous
+                # buffer on all cores
+                hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            else:
+                hash_obj = _new_hash_obj(algo)
+            hash_obj.update(mm)
+            return hash_obj.hexdigest()
+    except (ValueError, OSError):
+        pass
+
+    if algo == "sha256":
+        return _hash_file_sha256(f).hexdigest()
+    hash_obj = _new_hash_obj(algo)
+    while chunk := f.read(HASH_CHUNK_SIZE):
+        hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
 
 class StorageManager:
-    """Manages .model-sentinel directory structure and data persistence."""
+    """Manages .model-sentinel directory structure and data persistence.
+
+    Verification data is sharded per model: registry.json holds one small
+    entry per model, while file hashes and contents live under each model's
+    own directory. Loading data for one model therefore never parses other
+    models' records, keeping memory bounded by the single-model subtree.
+    """
 
     def __init__(self, base_dir: Path = Path(".model-sentinel")):
         """Initialize storage manager.
@@ -20,14 +203,35 @@ class StorageManager:
         self.registry_file = self.base_dir / "registry.json"
         self.hf_dir = self.base_dir / "hf"
         self.local_dir = self.base_dir / "local"
+        # Stat-keyed file hash cache, loaded lazily and flushed explicitly
+        self.hash_cache_file = self.base_dir / "hash_cache.json"
+        self._hash_cache: Optional[Dict[str, str]] = None
+        self._hash_cache_dirty = False
+        # Parsed metadata.json per model, validated against the file's mtime
+        # so concurrent StorageManager instances never serve stale data
+        self._metadata_cache: Dict[str, tuple[int, Dict[str, Any]]] = {}
+        # Parsed registry.json, validated the same way
+        self._registry_cache: Optional[tuple[int, Dict[str, Any]]] = None
+        # Content-derived directory names per local model path, validated
+        # against a (path, size, mtime_ns) signature of the tree so a repeat
+        # call skips hashing but still notices edited or added files
+        self._local_dir_name_cache: Dict[str, tuple[tuple, str]] = {}
+        # Timestamp fixed on first use so one run writes one consistent "now"
+        self._run_timestamp: Optional[str] = None
 
     def get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO format.
+        """Get the timestamp for this run in ISO format.
+
+        The first call fixes the value for the manager's lifetime, so all
+        records written during one verification run carry the same "now"
+        instead of formatting a fresh datetime per record.
 
         Returns:
             Current timestamp as ISO 8601 string
         """
-        return datetime.now().isoformat()
+        if self._run_timestamp is None:
+            self._run_timestamp = datetime.now().isoformat()
+        return self._run_timestamp
 
     def ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
@@ -40,8 +244,8 @@ class StorageManager:
 
         The name is derived from the directory content to improve portability
         and reproducibility. It uses the SHA-256 hash of all "*.py" files
-        under the directory, computed by concatenating each file's relative
-        path (to the root) and its binary content in sorted order.
+        under the directory, computed over each file's relative path (to the
+        root) and its content digest in sorted order.
 
         Args:
             model_path: Path to the local model directory
@@ -49,32 +253,179 @@ class StorageManager:
         Returns:
             Directory name in format: {model_name}_{content_hash8}
         """
-        readable_name = model_path.name
-        content_hash = self.calculate_directory_hash(model_path, pattern="*.py")
-        return f"{readable_name}_{content_hash[:8]}"
+        files = sorted(scan_files_by_pattern(model_path, "*.py"))
+        signature = tuple(
+            (str(f), st.st_size, st.st_mtime_ns)
+            for f, st in ((f, f.stat()) for f in files)
+        )
+        cache_key = str(model_path)
+        cached = self._local_dir_name_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        content_hash = self.calculate_directory_hash(
+            model_path, pattern="*.py", files=files
+        )
+        dir_name = f"{model_path.name}_{content_hash[:8]}"
+        self._local_dir_name_cache[cache_key] = (signature, dir_name)
+        return dir_name
+
+    def _load_hash_cache(self) -> Dict[str, str]:
+        """Load the persisted hash cache, tolerating a missing/corrupt file."""
+        if self._hash_cache is None:
+            try:
+                self._hash_cache = _json_loads(self.hash_cache_file.read_bytes())
+            except (OSError, ValueError):
+                self._hash_cache = {}
+        return self._hash_cache
+
+    def flush_hash_cache(self) -> None:
+        """Persist the hash cache if it accumulated new entries."""
+        if self._hash_cache_dirty and self._hash_cache is not None:
+            self.ensure_directories()
+            self._write_json_atomic(self.hash_cache_file, self._hash_cache)
+            self._hash_cache_dirty = False
+
+    def calculate_file_hash(
+        self,
+        file_path: Path | str,
+        max_bytes: Optional[int] = None,
+        algo: str = "sha256",
+    ) -> str:
+        """Calculate a content hash for a file.
+
+        Results are cached keyed on (absolute path, size, mtime_ns), so
+        repeated verification runs over unchanged trees only pay a stat per
+        file instead of re-reading its content. Call flush_hash_cache() to
+        persist new entries.
+
+        Args:
+            file_path: File to hash
+            max_bytes: If set, hash only the first max_bytes of content and
+                mix the file size into the digest. Intended for very large
+                weight files where a prefix+size fingerprint is sufficient.
+            algo: Hash algorithm, "sha256" (default) or "blake3" (needs the
+                optional blake3 package). Hashes from different algorithms
+                are cached under distinct keys so they are never compared.
+        """
+        st = os.stat(file_path)
+        cache = self._load_hash_cache()
+        key = f"{os.path.abspath(file_path)}|{st.st_size}|{st.st_mtime_ns}"
+        if max_bytes is not None:
+            key += f"|cap{max_bytes}"
+        if algo != "sha256":
+            key += f"|{algo}"
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Typical .py files are tiny; a single read+digest beats the chunked
+        # loop's per-call overhead for anything under one chunk size.
+        if max_bytes is None and st.st_size < HASH_CHUNK_SIZE:
+            hash_obj = _new_hash_obj(algo)
+            with open(file_path, "rb") as f:
+                hash_obj.update(f.read())
+            file_hash = hash_obj.hexdigest()
+            cache[key] = file_hash
+            self._hash_cache_dirty = True
+            return file_hash
 
-    def calculate_file_hash(self, file_path: Path | str) -> str:
-        """Calculate SHA-256 hash for a file's binary content."""
-        hash_obj = hashlib.sha256()
         with open(file_path, "rb") as f:
-            while chunk := f.read(8192):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
+            if max_bytes is not None and st.st_size > max_bytes:
+                hash_obj = _new_hash_obj(algo)
+                remaining = max_bytes
+                while remaining > 0:
+                    chunk = f.read(min(HASH_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    hash_obj.update(chunk)
+                    remaining -= len(chunk)
+                hash_obj.update(st.st_size.to_bytes(8, "little"))
+                file_hash = hash_obj.hexdigest()
+            else:
+                file_hash = _hash_large_file(f, algo)
+
+        cache[key] = file_hash
+        self._hash_cache_dirty = True
+        return file_hash
 
     def calculate_directory_hash(
-        self, directory: Path | str, pattern: str = "*.py"
+        self,
+        directory: Path | str,
+        pattern: str = "*.py",
+        files: Optional[list[Path]] = None,
+        algo: str = "sha256",
+        weight_max_bytes: Optional[int] = None,
     ) -> str:
-        """Calculate SHA-256 hash for files in a directory matching a pattern."""
-        hash_obj = hashlib.sha256()
-        directory_path = Path(directory)
+        """Calculate a content hash for files in a directory matching a pattern.
 
-        for file_path in sorted(directory_path.rglob(pattern)):
-            rel_path = file_path.relative_to(directory_path)
-            hash_obj.update(str(rel_path).encode())
-            with open(file_path, "rb") as f:
-                while chunk := f.read(8192):
-                    hash_obj.update(chunk)
+        Each file's content digest is computed independently (concurrently
+        when there are several files - hashing releases the GIL), then folded
+        into the directory digest in sorted path order together with the
+        file's relative path, so the result is deterministic.
 
+        Args:
+            directory: Root directory the hash is relative to
+            pattern: Glob pattern for selecting files (ignored if files given)
+            files: Optional pre-enumerated file list; pass this when the
+                caller already walked the tree to avoid a second rglob pass.
+            algo: Hash algorithm, "sha256" (default) or "blake3"
+            weight_max_bytes: If set, files with a weight extension
+                (WEIGHT_FILE_EXTENSIONS) are fingerprinted from their first
+                weight_max_bytes plus size instead of hashed fully. Opt-in:
+                a prefix+size fingerprint misses a same-size change past the
+                cap, so callers must choose that trade-off explicitly
+                (WEIGHT_HASH_MAX_BYTES is a reasonable cap).
+        """
+        directory_path = Path(directory)
+        files = sorted(
+            scan_files_by_pattern(directory_path, pattern) if files is None else files
+        )
+
+        def _hash_one(file_path: Path) -> str:
+            if (
+                weight_max_bytes is not None
+                and file_path.suffix in WEIGHT_FILE_EXTENSIONS
+            ):
+                return self.calculate_file_hash(
+                    file_path, max_bytes=weight_max_bytes, algo=algo
+                )
+            return self.calculate_file_hash(file_path, algo=algo)
+
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                file_hashes = list(executor.map(_hash_one, files))
+        else:
+            file_hashes = [_hash_one(file_path) for file_path in files]
+
+        # Join the (relative path, digest) pairs into one buffer and hash it
+        # with a single update call; the concatenated bytes match what the
+        # old per-file relative_to loop fed in, so digests are unchanged.
+        # The relative path is a prefix strip only when the directory
+        # spelling is a true prefix of the walked path; pathlib normalizes
+        # spellings like "./a.py" to "a.py", and those fall back to relpath
+        # so the digest never depends on how the directory was spelled.
+        fromhex = bytes.fromhex
+        dir_str = str(directory_path)
+        prefix = dir_str + os.sep
+        prefix_len = len(prefix)
+        relpath = os.path.relpath
+
+        def _relative(file_path: Path) -> str:
+            path_str = str(file_path)
+            if path_str.startswith(prefix):
+                return path_str[prefix_len:]
+            return relpath(path_str, dir_str)
+
+        hash_obj = _new_hash_obj(algo)
+        hash_obj.update(
+            b"".join(
+                _relative(file_path).encode() + fromhex(file_hash)
+                for file_path, file_hash in zip(files, file_hashes)
+            )
+        )
+
+        self.flush_hash_cache()
         return hash_obj.hexdigest()
 
     def get_local_model_dir(self, model_path: Path) -> Path:
@@ -99,14 +450,8 @@ class StorageManager:
         Returns:
             Path to directory for this model
         """
-        # Split repo_id into org/model format
-        if "/" in repo_id:
-            org, model = repo_id.split("/", 1)
-        else:
-            org = ""
-            model = repo_id
-
-        return self.hf_dir / org / f"{model}@{revision}"
+        org, model_at_rev = _hf_dir_parts(repo_id, revision)
+        return self.hf_dir / org / model_at_rev
 
     def load_registry(self) -> Dict[str, Any]:
         """Load registry.json file.
@@ -114,11 +459,47 @@ class StorageManager:
         Returns:
             Registry data dictionary
         """
-        if not self.registry_file.exists():
+        try:
+            mtime_ns = self.registry_file.stat().st_mtime_ns
+        except OSError:
             return {"models": {}}
 
-        with open(self.registry_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        if self._registry_cache is not None and self._registry_cache[0] == mtime_ns:
+            return self._registry_cache[1]
+
+        registry = _json_loads(self.registry_file.read_bytes())
+
+        # The model type is encoded in the registry key ("hf/..." or
+        # "local/..."), so newer registries no longer duplicate it per entry.
+        # Backfill it here for consumers (and for legacy files it is a no-op).
+        for model_key, model_info in registry.get("models", {}).items():
+            model_info.setdefault("type", model_key.split("/", 1)[0])
+
+        self._registry_cache = (mtime_ns, registry)
+        return registry
+
+    def _write_json_atomic(self, target_file: Path, data: Dict[str, Any]) -> None:
+        """Write JSON to target_file atomically (temp file + rename).
+
+        Avoids leaving a partially written file behind if the process dies
+        mid-write; readers always see either the old or the new content.
+        No-op saves (bytes identical to what is on disk) skip the write and
+        its fsync entirely.
+        """
+        payload = _json_dumps(data)
+        try:
+            if target_file.read_bytes() == payload:
+                return
+        except OSError:
+            pass
+        tmp_file = target_file.with_suffix(target_file.suffix + ".tmp")
+        with open(tmp_file, "wb") as f:
+            # One prebuilt buffer, one write; fsync before the rename so the
+            # new name never points at data the kernel has not persisted
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, target_file)
 
     def save_registry(self, registry_data: Dict[str, Any]) -> None:
         """Save registry.json file.
@@ -127,8 +508,20 @@ class StorageManager:
             registry_data: Registry data to save
         """
         self.ensure_directories()
-        with open(self.registry_file, "w", encoding="utf-8") as f:
-            json.dump(registry_data, f, indent=2, ensure_ascii=False)
+        # The type is derivable from the registry key, so strip it from the
+        # serialized form. load_registry backfills it into loaded entries, so
+        # without this a previously-loaded entry would write "type" back out.
+        models = registry_data.get("models", {})
+        serializable = dict(registry_data)
+        serializable["models"] = {
+            model_key: {k: v for k, v in model_info.items() if k != "type"}
+            for model_key, model_info in models.items()
+        }
+        self._write_json_atomic(self.registry_file, serializable)
+        # Keep the cached copy equivalent to a fresh load (type backfill)
+        for model_key, model_info in models.items():
+            model_info.setdefault("type", model_key.split("/", 1)[0])
+        self._registry_cache = (self.registry_file.stat().st_mtime_ns, registry_data)
 
     def load_metadata(self, model_dir: Path) -> Dict[str, Any]:
         """Load metadata.json for a specific model.
@@ -140,11 +533,19 @@ class StorageManager:
             Metadata dictionary
         """
         metadata_file = model_dir / "metadata.json"
-        if not metadata_file.exists():
+        try:
+            mtime_ns = metadata_file.stat().st_mtime_ns
+        except OSError:
             return {"model_hash": None, "last_verified": None, "approved_files": []}
 
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        cache_key = str(metadata_file)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        metadata = _json_loads(metadata_file.read_bytes())
+        self._metadata_cache[cache_key] = (mtime_ns, metadata)
+        return metadata
 
     def save_metadata(self, model_dir: Path, metadata: Dict[str, Any]) -> None:
         """Save metadata.json for a specific model.
@@ -155,9 +556,11 @@ class StorageManager:
         """
         model_dir.mkdir(parents=True, exist_ok=True)
         metadata_file = model_dir / "metadata.json"
-
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        self._write_json_atomic(metadata_file, metadata)
+        self._metadata_cache[str(metadata_file)] = (
+            metadata_file.stat().st_mtime_ns,
+            metadata,
+        )
 
     def save_file_content(self, model_dir: Path, filename: str, content: str) -> None:
         """Save file content to model's files directory.
@@ -176,6 +579,24 @@ class StorageManager:
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
 
+    def save_file_content_bytes(
+        self, model_dir: Path, filename: str, content: bytes
+    ) -> None:
+        """Save pre-encoded file content to model's files directory.
+
+        Callers that already encoded the content (e.g. to record its byte
+        size) can write those bytes directly instead of paying a second
+        UTF-8 encode inside the text layer.
+
+        Args:
+            model_dir: Model directory
+            filename: Original filename
+            content: UTF-8 encoded file content to save
+        """
+        file_path = model_dir / "files" / filename
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+
     def load_file_content(self, model_dir: Path, filename: str) -> Optional[str]:
         """Load file content from model's files directory.
 
@@ -196,15 +617,19 @@ class StorageManager:
     def save_original_path(self, model_dir: Path, original_path: str) -> None:
         """Save original path information for local models.
 
+        Stored inside metadata.json rather than a dedicated file, so reading
+        a model's records stays one open/parse instead of two. Unchanged
+        values are not rewritten.
+
         Args:
             model_dir: Model directory
             original_path: Original model path
         """
-        model_dir.mkdir(parents=True, exist_ok=True)
-        path_file = model_dir / "original_path.txt"
-
-        with open(path_file, "w", encoding="utf-8") as f:
-            f.write(original_path)
+        metadata = self.load_metadata(model_dir)
+        if metadata.get("original_path") == original_path:
+            return
+        metadata["original_path"] = original_path
+        self.save_metadata(model_dir, metadata)
 
     def load_original_path(self, model_dir: Path) -> Optional[str]:
         """Load original path information for local models.
@@ -215,6 +640,12 @@ class StorageManager:
         Returns:
             Original model path or None if not found
         """
+        original_path = self.load_metadata(model_dir).get("original_path")
+        if original_path:
+            return original_path
+
+        # Models recorded before the move into metadata.json kept the path
+        # in a sidecar file
         path_file = model_dir / "original_path.txt"
         if not path_file.exists():
             return None
@@ -245,8 +676,9 @@ class StorageManager:
         registry = self.load_registry()
         model_key = self.get_model_key(model_type, model_id)
 
+        # "type" is not persisted: it is already encoded in the model key and
+        # load_registry backfills it for consumers.
         model_info = {
-            "type": model_type,
             "last_verified": self.get_current_timestamp(),
             "status": "verified",
             **kwargs,
@@ -1,5 +1,8 @@
+import os
 import pydoc
+import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -14,6 +17,10 @@ from model_sentinel.verify.storage import StorageManager
 
 FILES_NONE_VERIFIED = "  Files: None verified"
 
+# Above this size, pager text is streamed through a pipe instead of being
+# handed to pydoc.pager (which may buffer it into a temp file).
+PAGER_STREAM_THRESHOLD = 64_000
+
 
 class Verify:
     """Base class for verifying model changes and file integrity."""
@@ -22,6 +29,23 @@ class Verify:
         # Storage system
         self.storage = StorageManager()
 
+    def _page_text(self, text: str) -> None:
+        """Show text in the pager, streaming large payloads through a pipe.
+
+        pipepager swallows pager failures internally, so a missing pager
+        command would silently discard the text; only take the streaming
+        path when a pager is known to exist ($PAGER, like pydoc itself
+        prefers, or less on PATH).
+        """
+        if len(text) > PAGER_STREAM_THRESHOLD:
+            pager_cmd = os.environ.get("PAGER")
+            if not pager_cmd and shutil.which("less"):
+                pager_cmd = "less -R"
+            if pager_cmd:
+                pydoc.pipepager(text, pager_cmd)
+                return
+        pydoc.pager(text)
+
     def _update_file_metadata(
         self, model_dir: Path, filename: str, file_hash: str, content: str
     ) -> None:
@@ -34,14 +58,16 @@ class Verify:
             file_hash: File hash
             content: File content
         """
-        # Save file content
-        self.storage.save_file_content(model_dir, filename, content)
+        # Encode once: the bytes are both written to disk and measured for
+        # the size field, instead of encoding separately for each
+        encoded = content.encode("utf-8")
+        self.storage.save_file_content_bytes(model_dir, filename, encoded)
 
         # Update approved_files entry
         metadata = self.storage.load_metadata(model_dir)
         approved = metadata.get("approved_files") or []
         ts = self.storage.get_current_timestamp()
-        size = len(content.encode("utf-8"))
+        size = len(encoded)
         # Replace or append
         replaced = False
         for item in approved:
@@ -81,11 +107,15 @@ class Verify:
 
         def prompt_user_verification(item_name, content):
             """Prompt user for verification of changes."""
-            pydoc.pager(
-                f"{item_name} has been updated.\n"
-                f"--- Content of {item_name} ---\n\n"
-                + content
-                + "\n\n--- End of content ---\n"
+            self._page_text(
+                "".join(
+                    [
+                        f"{item_name} has been updated.\n",
+                        f"--- Content of {item_name} ---\n\n",
+                        content,
+                        "\n\n--- End of content ---\n",
+                    ]
+                )
             )
 
             message = f"Do you trust {item_name}? (y/N): "
@@ -100,6 +130,73 @@ class Verify:
             print("Trust not confirmed. Please review the file changes.")
             return False
 
+    def verify_files_batch(
+        self, files: list[dict[str, Any]], model_dir: Path
+    ) -> dict[str, bool] | None:
+        """Review several changed files in one pager session.
+
+        Shows all contents in a single pager invocation, then asks for one
+        trust decision covering the whole set. The user can answer "s" to
+        fall back to per-file prompts.
+
+        Args:
+            files: Items containing {"filename", "hash", "content"}
+            model_dir: Model directory
+
+        Returns:
+            Mapping of filename to approval, or None if the user chose
+            per-file selection.
+        """
+        sections = []
+        for file_info in files:
+            filename = file_info["filename"]
+            sections.append(
+                f"--- Content of {filename} ---\n\n"
+                + file_info["content"]
+                + "\n\n--- End of content ---"
+            )
+        self._page_text(
+            f"{len(files)} files have been updated.\n\n" + "\n\n".join(sections) + "\n"
+        )
+
+        message = (
+            f"Do you trust all {len(files)} files? (y/N/s=review individually): "
+        )
+        response = input(message).lower()
+        if response in ["s", "select"]:
+            return None
+
+        approved = response in ["y", "yes"]
+        if approved:
+            for file_info in files:
+                self._update_file_metadata(
+                    model_dir,
+                    file_info["filename"],
+                    file_info["hash"],
+                    file_info["content"],
+                )
+            print("Trust confirmed. File contents and hashes updated.")
+        else:
+            print("Trust not confirmed. Please review the file changes.")
+
+        return {file_info["filename"]: approved for file_info in files}
+
+    def record_verified_file(
+        self, filename: str, file_hash: str, content: str, model_dir: Path
+    ) -> None:
+        """Record a file as verified without prompting.
+
+        Used when trust was already established for identical content earlier
+        in the same session.
+
+        Args:
+            filename: Name of the file
+            file_hash: File hash
+            content: File content
+            model_dir: Model directory
+        """
+        self._update_file_metadata(model_dir, filename, file_hash, content)
+
     def update_model_hash(self, model_dir: Path, new_hash: str) -> None:
         """Update model hash in metadata.
 
@@ -330,6 +427,20 @@ class Verify:
         else:
             raise ValueError("Unable to determine model type")
 
+    def _resolve_target(
+        self, verification_result: dict[str, Any]
+    ) -> tuple[str, str, str, Path | None]:
+        """Resolve (model_key, model_type, model_id, model_dir) in one pass.
+
+        The registry key and the storage directory branch on the same target
+        type; resolving them together means callers switch on it once
+        instead of re-deriving pieces of the same answer.
+        """
+        model_key = self.get_model_key_from_result(verification_result)
+        model_type, model_id = model_key.split("/", 1)
+        model_dir = self._resolve_model_dir(verification_result=verification_result)
+        return model_key, model_type, model_id, model_dir
+
     def save_verification_results(
         self, verification_result: dict[str, Any], approved_files: list[str]
     ) -> str:
@@ -351,13 +462,12 @@ class Verify:
                 f"🔍 Saving verification results for {len(approved_files)} approved files: {approved_files}"
             )
 
-            # Determine model key and get directory
-            model_key = self.get_model_key_from_result(verification_result)
+            # Determine model key, type, id and directory in one resolution
+            model_key, model_type, model_id, model_dir = self._resolve_target(
+                verification_result
+            )
             print(f"🔑 Model key: {model_key}")
 
-            # Get model directory
-            model_dir = self._resolve_model_dir(verification_result=verification_result)
-
             # Update model hash if changed
             if verification_result.get("new_model_hash"):
                 self.update_model_hash(model_dir, verification_result["new_model_hash"])
@@ -376,7 +486,6 @@ class Verify:
             )
 
             # Register model in registry
-            model_type, model_id = model_key.split("/", 1)
             kwargs = {}
             if verification_result.get("target_type") == "local":
                 kwargs["original_path"] = verification_result["model_dir"]
@@ -398,20 +507,69 @@ class Verify:
         verification_result: dict[str, Any],
         approved_files: list[str],
     ) -> int:
-        """Update file hashes for approved files using storage system."""
+        """Update file hashes for approved files using storage system.
+
+        Metadata is loaded once, every approved entry is folded into it, and
+        it is saved once, so approving n files costs one JSON round-trip
+        instead of n.
+        """
         files_info = verification_result.get("files_info", [])
+        approved_set = frozenset(approved_files)
         approved_count = 0
 
+        metadata = None
+        content_writes: list[tuple[str, str]] = []
         for file_info in files_info:
             filename = file_info.get("filename", "")
             file_hash = file_info.get("hash", "")
             content = file_info.get("content", "")
 
-            if filename in approved_files and file_hash:
-                self._update_file_metadata(model_dir, filename, file_hash, content)
+            if filename in approved_set and file_hash:
+                if metadata is None:
+                    metadata = self.storage.load_metadata(model_dir)
+                    approved = metadata.get("approved_files") or []
+                    approved_by_path = {item.get("path"): item for item in approved}
+                    ts = self.storage.get_current_timestamp()
+                content_writes.append((filename, content))
+                size = file_info.get("size")
+                if size is None:
+                    size = len(content.encode("utf-8"))
+                entry = approved_by_path.get(filename)
+                if entry is None:
+                    entry = {
+                        "path": filename,
+                        "hash": file_hash,
+                        "size": size,
+                        "verified_at": ts,
+                    }
+                    approved.append(entry)
+                    approved_by_path[filename] = entry
+                else:
+                    entry["hash"] = file_hash
+                    entry["size"] = size
+                    entry["verified_at"] = ts
                 approved_count += 1
                 print(f"✅ Approved file: {filename} - {file_hash[:16]}...")
 
+        # Content writes are independent files; let the kernel flush them
+        # concurrently instead of serializing on each write
+        if len(content_writes) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(content_writes))
+            ) as executor:
+                for _ in executor.map(
+                    lambda write: self.storage.save_file_content(model_dir, *write),
+                    content_writes,
+                ):
+                    pass
+        elif content_writes:
+            self.storage.save_file_content(model_dir, *content_writes[0])
+
+        if metadata is not None:
+            metadata["approved_files"] = approved
+            metadata["last_verified"] = ts
+            self.storage.save_metadata(model_dir, metadata)
+
         return approved_count
 
     def write_session_metadata(
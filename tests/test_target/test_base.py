@@ -3,9 +3,11 @@ Tests for model_sentinel.target.base module.
 """
 
 import hashlib
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from model_sentinel.target.base import TargetBase, VERIFICATION_FAILED_MESSAGE
 
@@ -97,12 +99,12 @@ class TestTargetBase(unittest.TestCase):
         # Calculate hash manually for verification
         hash_obj = hashlib.sha256()
 
-        # Files should be processed in sorted order
+        # Per-file digests are folded in sorted path order
         py_files = sorted(self.temp_dir.rglob("*.py"))
         for file_path in py_files:
             rel_path = file_path.relative_to(self.temp_dir)
             hash_obj.update(str(rel_path).encode())
-            hash_obj.update(file_path.read_bytes())
+            hash_obj.update(hashlib.sha256(file_path.read_bytes()).digest())
 
         expected_hash = hash_obj.hexdigest()
         result_hash = self.target._calculate_directory_hash(self.temp_dir)
@@ -117,7 +119,7 @@ class TestTargetBase(unittest.TestCase):
         hash_obj = hashlib.sha256()
         rel_path = self.test_txt_file.relative_to(self.temp_dir)
         hash_obj.update(str(rel_path).encode())
-        hash_obj.update(self.test_txt_file.read_bytes())
+        hash_obj.update(hashlib.sha256(self.test_txt_file.read_bytes()).digest())
         expected_hash = hash_obj.hexdigest()
 
         self.assertEqual(result_hash, expected_hash)
@@ -166,5 +168,72 @@ class TestTargetBase(unittest.TestCase):
         self.assertEqual(result_hash, expected_hash)
 
 
+class TestVerifyFilesWorkflow(unittest.TestCase):
+    """Test cases for the interactive multi-file verification workflow."""
+
+    def setUp(self):
+        self.target = TargetBase()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        # Route both storage instances to the temp dir
+        self.target.storage = self.target.storage.__class__(
+            self.temp_dir / ".model-sentinel"
+        )
+        self.target.verify.storage = self.target.storage
+        self.model_dir = self.temp_dir / "model_records"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _approved_files(self):
+        metadata = self.target.storage.load_metadata(self.model_dir)
+        return {item["path"]: item["hash"] for item in metadata["approved_files"]}
+
+    @patch("pydoc.pager")
+    def test_batch_select_falls_back_to_per_file_prompts(self, mock_pager):
+        """Answering 's' to the batch prompt drops into per-file prompts."""
+        files = [
+            {"filename": "a.py", "hash": "hash_a", "content": "a = 1"},
+            {"filename": "b.py", "hash": "hash_b", "content": "b = 2"},
+        ]
+        # "s" to the batch prompt, then approve a.py and reject b.py
+        with patch("builtins.input", side_effect=["s", "y", "n"]) as mock_input:
+            result = self.target._verify_files_workflow(files, self.model_dir)
+
+        self.assertFalse(result)
+        self.assertEqual(mock_input.call_count, 3)
+        self.assertEqual(self._approved_files(), {"a.py": "hash_a"})
+
+    @patch("pydoc.pager")
+    def test_duplicate_content_prompts_once(self, mock_pager):
+        """An identical file reuses the session's trust decision, no reprompt."""
+        files = [
+            {"filename": "a.py", "hash": "same_hash", "content": "x = 1"},
+            {"filename": "copy.py", "hash": "same_hash", "content": "x = 1"},
+        ]
+        # "s" to the batch prompt, then a single approval covering both
+        with patch("builtins.input", side_effect=["s", "y"]) as mock_input:
+            result = self.target._verify_files_workflow(files, self.model_dir)
+
+        self.assertTrue(result)
+        self.assertEqual(mock_input.call_count, 2)
+        self.assertEqual(
+            self._approved_files(), {"a.py": "same_hash", "copy.py": "same_hash"}
+        )
+
+    @patch("pydoc.pager")
+    def test_duplicate_content_reuses_rejection(self, mock_pager):
+        """A rejected file's duplicate is rejected without another prompt."""
+        files = [
+            {"filename": "a.py", "hash": "same_hash", "content": "x = 1"},
+            {"filename": "copy.py", "hash": "same_hash", "content": "x = 1"},
+        ]
+        with patch("builtins.input", side_effect=["s", "n"]) as mock_input:
+            result = self.target._verify_files_workflow(files, self.model_dir)
+
+        self.assertFalse(result)
+        self.assertEqual(mock_input.call_count, 2)
+        self.assertEqual(self._approved_files(), {})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -78,7 +78,9 @@ class TestTargetHF(unittest.TestCase):
 
         self.assertIsNone(result)
         mock_api.model_info.assert_called_once_with(
-            repo_id=self.test_repo_id, revision=self.test_revision
+            repo_id=self.test_repo_id,
+            revision=self.test_revision,
+            files_metadata=False,
         )
 
     @patch("model_sentinel.target.hf.HfApi")
@@ -202,10 +204,12 @@ class TestTargetHF(unittest.TestCase):
                 )
 
             self.assertEqual(result, "print('hello world')")
+            # Cache hit: only the local_files_only attempt is made
             mock_api.hf_hub_download.assert_called_once_with(
                 repo_id=self.test_repo_id,
                 filename="test.py",
                 revision=self.test_revision,
+                local_files_only=True,
             )
         finally:
             # Clean up temporary file
@@ -371,8 +375,8 @@ class TestVerifyHFModel(unittest.TestCase):
             "model_sentinel.target.hf._handle_gui_verification", return_value=False
         ) as mock_gui:
             with patch("builtins.print"):
-                with patch("builtins.exit") as mock_exit:
-                    result = verify_hf_model(
+                with self.assertRaises(SystemExit) as ctx:
+                    verify_hf_model(
                         self.test_repo_id,
                         revision=self.test_revision,
                         gui=True,
@@ -380,8 +384,7 @@ class TestVerifyHFModel(unittest.TestCase):
                     )
 
         mock_gui.assert_called_once()
-        mock_exit.assert_called_once_with(1)
-        self.assertFalse(result)
+        self.assertEqual(ctx.exception.code, 1)
 
     @patch("model_sentinel.target.hf.TargetHF")
     def test_verify_hf_model_gui_closed_with_exit_on_reject_false(
@@ -1,5 +1,6 @@
 """Test cases for model_sentinel.target.local module."""
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -177,6 +178,28 @@ class TestTargetLocal(unittest.TestCase):
             self.assertIn("subdir/file2.py", filenames)
             self.assertIn("file3.py", filenames)
 
+    def test_get_files_for_verification_relative_dot_directory(self):
+        """Test filenames are intact when the model directory is '.'."""
+        with TemporaryDirectory() as temp_dir:
+            temp_model_dir = Path(temp_dir)
+            (temp_model_dir / "ax.py").write_text("a = 1")
+            (temp_model_dir / "bx.py").write_text("b = 2")
+            sub = temp_model_dir / "sub"
+            sub.mkdir()
+            (sub / "c.py").write_text("c = 3")
+
+            # Walked paths like "ax.py" have no "./" prefix to strip, so
+            # relative-name computation must not eat filename characters
+            cwd = os.getcwd()
+            os.chdir(temp_model_dir)
+            try:
+                result = self.target.get_files_for_verification(Path("."))
+            finally:
+                os.chdir(cwd)
+
+            filenames = sorted(file_info["filename"] for file_info in result)
+            self.assertEqual(filenames, ["ax.py", "bx.py", "sub/c.py"])
+
     def test_get_files_for_verification_no_python_files(self):
         """Test get_files_for_verification when no Python files exist."""
         with TemporaryDirectory() as temp_dir:
@@ -317,16 +340,16 @@ class TestVerifyLocalModel(unittest.TestCase):
                 return_value=False,
             ) as mock_gui:
                 with patch("builtins.print"):
-                    with patch("builtins.exit") as mock_exit:
-                        result = verify_local_model(
+                    with self.assertRaises(SystemExit) as ctx:
+                        verify_local_model(
                             temp_model_dir, gui=True, exit_on_reject=True
                         )
 
         mock_gui.assert_called_once()
 
-        # exit() should be called when exit_on_reject=True and verification fails
-        mock_exit.assert_called_once_with(1)
-        self.assertFalse(result)
+        # SystemExit(1) should be raised when exit_on_reject=True and
+        # verification fails
+        self.assertEqual(ctx.exception.code, 1)
 
     @patch("model_sentinel.target.local.TargetLocal")
     def test_verify_local_model_gui_closed_with_exit_on_reject_false(
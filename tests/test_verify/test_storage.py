@@ -1,4 +1,5 @@
 import hashlib
+import os
 import shutil
 import tempfile
 import unittest
@@ -46,6 +47,17 @@ class TestStorageManagerLocalDirName(unittest.TestCase):
         name2 = self.storage.generate_local_model_dir_name(self.model_dir)
         self.assertNotEqual(name1, name2)
 
+    def test_directory_hash_independent_of_spelling(self):
+        """The digest must not depend on how the directory path is spelled."""
+        abs_hash = self.storage.calculate_directory_hash(self.model_dir)
+        cwd = os.getcwd()
+        os.chdir(self.model_dir)
+        try:
+            dot_hash = self.storage.calculate_directory_hash(Path("."))
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(dot_hash, abs_hash)
+
     def test_empty_directory_hash_is_stable(self):
         empty_dir = self.tmpdir / "empty"
         empty_dir.mkdir()
@@ -54,3 +66,110 @@ class TestStorageManagerLocalDirName(unittest.TestCase):
         suffix = name.split("_", 1)[1]
         expected_hash8 = hashlib.sha256(b"").hexdigest()[:8]
         self.assertEqual(suffix, expected_hash8)
+
+
+class TestStorageManagerHashCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.file_path = self.tmpdir / "a.py"
+        self.file_path.write_text("print('A')\n", encoding="utf-8")
+        self.storage = StorageManager(base_dir=self.tmpdir / ".model-sentinel")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_cache_hit_keyed_on_size_and_mtime(self):
+        first = self.storage.calculate_file_hash(self.file_path)
+        # Replace content with same-length bytes and restore the mtime, so
+        # the stat signature is unchanged: the cached hash must be returned
+        # without re-reading the file.
+        st = os.stat(self.file_path)
+        self.file_path.write_text("print('B')\n", encoding="utf-8")
+        os.utime(self.file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(self.storage.calculate_file_hash(self.file_path), first)
+
+    def test_cache_miss_on_content_change(self):
+        first = self.storage.calculate_file_hash(self.file_path)
+        self.file_path.write_text("print('changed')\n", encoding="utf-8")
+        second = self.storage.calculate_file_hash(self.file_path)
+        self.assertNotEqual(first, second)
+        expected = hashlib.sha256(self.file_path.read_bytes()).hexdigest()
+        self.assertEqual(second, expected)
+
+    def test_max_bytes_cached_under_distinct_key(self):
+        self.file_path.write_bytes(b"x" * 4096)
+        full = self.storage.calculate_file_hash(self.file_path)
+        capped = self.storage.calculate_file_hash(self.file_path, max_bytes=1024)
+        self.assertNotEqual(full, capped)
+        # Both stay cached independently
+        self.assertEqual(self.storage.calculate_file_hash(self.file_path), full)
+        self.assertEqual(
+            self.storage.calculate_file_hash(self.file_path, max_bytes=1024), capped
+        )
+
+    def test_flush_persists_cache_across_instances(self):
+        first = self.storage.calculate_file_hash(self.file_path)
+        self.storage.flush_hash_cache()
+        self.assertTrue(self.storage.hash_cache_file.exists())
+
+        # A fresh instance must serve the persisted entry without re-hashing:
+        # swap the content but restore the stat signature, and expect the
+        # old hash back.
+        st = os.stat(self.file_path)
+        self.file_path.write_text("print('B')\n", encoding="utf-8")
+        os.utime(self.file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        fresh = StorageManager(base_dir=self.tmpdir / ".model-sentinel")
+        self.assertEqual(fresh.calculate_file_hash(self.file_path), first)
+
+    def test_corrupt_cache_file_is_ignored(self):
+        self.storage.calculate_file_hash(self.file_path)
+        self.storage.flush_hash_cache()
+        self.storage.hash_cache_file.write_text("{not json", encoding="utf-8")
+
+        fresh = StorageManager(base_dir=self.tmpdir / ".model-sentinel")
+        expected = hashlib.sha256(self.file_path.read_bytes()).hexdigest()
+        self.assertEqual(fresh.calculate_file_hash(self.file_path), expected)
+
+
+class TestStorageManagerOriginalPath(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.storage = StorageManager(base_dir=self.tmpdir / ".model-sentinel")
+        self.model_dir = self.storage.local_dir / "model_deadbeef"
+        self.model_dir.mkdir(parents=True, exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_save_writes_metadata_not_sidecar_file(self):
+        self.storage.save_original_path(self.model_dir, "/path/to/model")
+        self.assertEqual(
+            self.storage.load_original_path(self.model_dir), "/path/to/model"
+        )
+        metadata = self.storage.load_metadata(self.model_dir)
+        self.assertEqual(metadata.get("original_path"), "/path/to/model")
+        self.assertFalse((self.model_dir / "original_path.txt").exists())
+
+    def test_legacy_sidecar_file_fallback(self):
+        # Models recorded before the move into metadata.json only have the
+        # sidecar file
+        (self.model_dir / "original_path.txt").write_text(
+            "/legacy/model\n", encoding="utf-8"
+        )
+        self.assertEqual(self.storage.load_original_path(self.model_dir), "/legacy/model")
+
+    def test_metadata_preferred_over_legacy_sidecar(self):
+        (self.model_dir / "original_path.txt").write_text(
+            "/legacy/model\n", encoding="utf-8"
+        )
+        self.storage.save_original_path(self.model_dir, "/current/model")
+        self.assertEqual(
+            self.storage.load_original_path(self.model_dir), "/current/model"
+        )
+
+    def test_missing_everywhere_returns_none(self):
+        self.assertIsNone(self.storage.load_original_path(self.model_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
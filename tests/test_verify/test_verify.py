@@ -541,5 +541,57 @@ class TestVerifyBusinessLogic(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestVerifyFilesBatch(unittest.TestCase):
+    """Test cases for the batched multi-file trust prompt."""
+
+    def setUp(self):
+        self.verify = Verify()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.verify.storage = StorageManager(self.temp_dir / ".model-sentinel")
+        self.model_dir = self.temp_dir / "test_model"
+        self.files = [
+            {"filename": "a.py", "hash": "hash_a", "content": "a = 1"},
+            {"filename": "b.py", "hash": "hash_b", "content": "b = 2"},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _approved_files(self):
+        metadata = self.verify.storage.load_metadata(self.model_dir)
+        return {item["path"]: item["hash"] for item in metadata["approved_files"]}
+
+    @patch("pydoc.pager")
+    def test_batch_approve_all(self, mock_pager):
+        """One 'y' approves every file and records content and hashes."""
+        with patch("builtins.input", return_value="y") as mock_input:
+            result = self.verify.verify_files_batch(self.files, self.model_dir)
+
+        self.assertEqual(result, {"a.py": True, "b.py": True})
+        mock_input.assert_called_once()
+        mock_pager.assert_called_once()
+        self.assertEqual(self._approved_files(), {"a.py": "hash_a", "b.py": "hash_b"})
+        saved = (self.model_dir / "files" / "a.py").read_text(encoding="utf-8")
+        self.assertEqual(saved, "a = 1")
+
+    @patch("pydoc.pager")
+    def test_batch_reject_all(self, mock_pager):
+        """Anything but 'y' rejects every file and records nothing."""
+        with patch("builtins.input", return_value="n"):
+            result = self.verify.verify_files_batch(self.files, self.model_dir)
+
+        self.assertEqual(result, {"a.py": False, "b.py": False})
+        self.assertEqual(self._approved_files(), {})
+
+    @patch("pydoc.pager")
+    def test_batch_select_returns_none(self, mock_pager):
+        """'s' opts out of the batch decision without recording anything."""
+        with patch("builtins.input", return_value="s"):
+            result = self.verify.verify_files_batch(self.files, self.model_dir)
+
+        self.assertIsNone(result)
+        self.assertEqual(self._approved_files(), {})
+
+
 if __name__ == "__main__":
     unittest.main()